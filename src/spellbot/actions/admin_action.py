@@ -205,6 +205,7 @@ class AdminAction(BaseAction):
             return
 
         await self.services.channels.forget(channel_xid)
+        self.bot.channel_policy.pop(channel_xid)
         await safe_send_channel(self.interaction, "Done.", ephemeral=True)
 
     async def info(self, game_id: str) -> None:
@@ -359,6 +360,7 @@ class AdminAction(BaseAction):
     async def set_auto_verify(self, setting: bool) -> None:
         assert self.interaction.channel_id is not None
         await self.services.channels.set_auto_verify(self.interaction.channel_id, setting)
+        self.bot.channel_policy.pop(self.interaction.channel_id)
         await safe_send_channel(
             self.interaction,
             f"Auto verification set to {setting} for this channel.",
@@ -368,6 +370,7 @@ class AdminAction(BaseAction):
     async def set_verified_only(self, setting: bool) -> None:
         assert self.interaction.channel_id is not None
         await self.services.channels.set_verified_only(self.interaction.channel_id, setting)
+        self.bot.channel_policy.pop(self.interaction.channel_id)
         await safe_send_channel(
             self.interaction,
             f"Verified only set to {setting} for this channel.",
@@ -377,6 +380,7 @@ class AdminAction(BaseAction):
     async def set_unverified_only(self, setting: bool) -> None:
         assert self.interaction.channel_id is not None
         await self.services.channels.set_unverified_only(self.interaction.channel_id, setting)
+        self.bot.channel_policy.pop(self.interaction.channel_id)
         await safe_send_channel(
             self.interaction,
             f"Unverified only set to {setting} for this channel.",
@@ -85,6 +85,8 @@ class BaseAction:
         if self.channel_data["auto_verify"]:
             verified = True
         await self.services.verifies.upsert(self.guild.id, self.interaction.user.id, verified)
+        if verified is not None:
+            self.bot.verify_cache.pop((self.guild.id, self.interaction.user.id))
         if not user_can_moderate(self.interaction.user, self.guild, self.channel):
             user_is_verified = await self.services.verifies.is_verified()
             if user_is_verified and self.channel_data["unverified_only"]:
@@ -20,6 +20,10 @@ class VerifyAction(BaseAction):
 
         assert self.interaction.guild_id is not None
         await self.services.verifies.upsert(self.interaction.guild_id, target_xid, setting)
+        key = (self.interaction.guild_id, target_xid)
+        # Queue the setting too so that it's reapplied after any in-flight flush
+        self.bot.verify_cache[key] = setting
+        self.bot.pending_verifies[key] = setting
         await safe_send_channel(
             self.interaction,
             f"{'Verified' if setting else 'Unverified'} <@{target_xid}>.",
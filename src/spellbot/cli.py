@@ -6,9 +6,7 @@ from os import getenv
 from socket import socket
 
 import click
-import hupper
 import uvloop
-from dotenv import load_dotenv
 
 from . import __version__
 from .environment import running_in_pytest
@@ -18,6 +16,8 @@ from .settings import settings
 
 # load .env environment variables as early as possible
 if not running_in_pytest():  # pragma: no cover
+    from dotenv import load_dotenv
+
     load_dotenv()
 
 if not getenv("DISABLE_UVLOOP", ""):  # pragma: no cover
@@ -77,6 +77,8 @@ def main(
     port: int | None = None,
 ) -> None:
     if dev:
+        import hupper
+
         hupper.start_reloader("spellbot.main")
 
     # Ensure that configure_logging() is called as early as possible
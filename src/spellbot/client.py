@@ -2,29 +2,55 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
+from secrets import token_hex
 from typing import TYPE_CHECKING
-from uuid import uuid4
 
 import discord
 from ddtrace import tracer
 from discord.ext.commands import AutoShardedBot, CommandError, CommandNotFound, Context
 
 from .database import db_session_manager, initialize_connection
-from .metrics import setup_ignored_errors, setup_metrics
+from .metrics import add_span_kv, setup_ignored_errors, setup_metrics
+from .models import AUTO_VERIFY, UNVERIFIED_ONLY, VERIFIED_ONLY
 from .operations import safe_delete_message
 from .services import ChannelsService, GamesService, GuildsService, VerifiesService
 from .settings import settings
 from .spelltable import generate_link
-from .utils import user_can_moderate
+from .utils import ExpiringDict, user_can_moderate
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncGenerator
+    from collections.abc import AsyncGenerator, Awaitable, Callable
+
+    from discord.abc import MessageableChannel
 
 logger = logging.getLogger(__name__)
 
+# Messages are handed off from the gateway to a pool of workers through a bounded
+# queue so that slow database work can never back up the event dispatcher.
+MESSAGE_QUEUE_SIZE = 1024
+MESSAGE_WORKERS = 4
+MESSAGE_DRAIN_TIMEOUT_S = 10
+
+# Guild, channel, and verify records observed from messages are written to the
+# database in bulk, either periodically or once enough of them have accumulated.
+VERIFY_FLUSH_INTERVAL_S = 0.5
+VERIFY_FLUSH_THRESHOLD = 200
+VERIFY_FLUSH_MAX_BACKOFF_S = 30
+
+# Channel verification settings and user verification status are cached locally so
+# that messages don't have to query the database for them every time.
+CHANNEL_POLICY_CACHE_SIZE = 4096
+CHANNEL_POLICY_CACHE_TTL_S = 60
+VERIFY_CACHE_SIZE = 16384
+VERIFY_CACHE_TTL_S = 30
+MODERATOR_CACHE_SIZE = 8192
+MODERATOR_CACHE_TTL_S = 30
+
 
 class SpellBot(AutoShardedBot):
+    create_spelltable_link: Callable[[], Awaitable[str | None]]
+
     def __init__(
         self,
         mock_games: bool = False,
@@ -42,8 +68,32 @@ class SpellBot(AutoShardedBot):
             application_id=settings.BOT_APPLICATION_ID,
         )
         self.mock_games = mock_games
+        # mock_games never changes after startup, so pick the link creator up front
+        self.create_spelltable_link = (
+            self._mock_spelltable_link if mock_games else self._real_spelltable_link
+        )
         self.create_connection = create_connection
         self.critical_lock = asyncio.Lock()
+        self.message_queue: asyncio.Queue[discord.Message] = asyncio.Queue(
+            maxsize=MESSAGE_QUEUE_SIZE,
+        )
+        self.pending_guilds: dict[int, discord.Guild] = {}
+        self.pending_channels: dict[int, MessageableChannel] = {}
+        self.pending_verifies: dict[tuple[int, int], bool | None] = {}
+        self.verify_flush_event = asyncio.Event()
+        self.channel_policy: ExpiringDict[int, int] = ExpiringDict(
+            max_len=CHANNEL_POLICY_CACHE_SIZE,
+            max_age_seconds=CHANNEL_POLICY_CACHE_TTL_S,
+        )
+        self.verify_cache: ExpiringDict[tuple[int, int], bool] = ExpiringDict(
+            max_len=VERIFY_CACHE_SIZE,
+            max_age_seconds=VERIFY_CACHE_TTL_S,
+        )
+        self.moderator_cache: ExpiringDict[tuple[int, int, tuple[int, ...]], bool] = ExpiringDict(
+            max_len=MODERATOR_CACHE_SIZE,
+            max_age_seconds=MODERATOR_CACHE_TTL_S,
+        )
+        self.background_tasks: list[asyncio.Task[None]] = []
 
     async def on_ready(self) -> None:  # pragma: no cover
         logger.info("client ready")
@@ -52,11 +102,6 @@ class SpellBot(AutoShardedBot):
         logger.info("shard %s ready", shard_id)
 
     async def setup_hook(self) -> None:  # pragma: no cover
-        # Note: In tests we create the connection using fixtures.
-        if self.create_connection:  # pragma: no cover
-            logger.info("initializing database connection...")
-            await initialize_connection("spellbot-bot")
-
         # register persistent views
         from .views import PendingGameView, SetupView, StartedGameView, StartedGameViewWithConfirm
 
@@ -68,7 +113,76 @@ class SpellBot(AutoShardedBot):
         # load all cog extensions and application commands
         from .utils import load_extensions
 
-        await load_extensions(self)
+        # Note: In tests we create the connection using fixtures.
+        if self.create_connection:  # pragma: no cover
+            # connecting to the database and loading extensions are independent
+            logger.info("initializing database connection...")
+            await asyncio.gather(initialize_connection("spellbot-bot"), load_extensions(self))
+        else:
+            await load_extensions(self)
+
+        # start draining the message queue and flushing verification records
+        self.background_tasks = [
+            asyncio.create_task(self.message_worker(), name=f"message-worker-{i}")
+            for i in range(MESSAGE_WORKERS)
+        ]
+        self.background_tasks.append(
+            asyncio.create_task(self.verification_flusher(), name="verification-flusher"),
+        )
+
+    async def close(self) -> None:  # pragma: no cover
+        # give the workers a chance to verify any queued messages before stopping them
+        if self.background_tasks:
+            try:
+                await asyncio.wait_for(self.message_queue.join(), MESSAGE_DRAIN_TIMEOUT_S)
+            except TimeoutError:
+                logger.warning("timed out draining the message queue on close")
+        for task in self.background_tasks:
+            task.cancel()
+        await asyncio.gather(*self.background_tasks, return_exceptions=True)
+        self.background_tasks.clear()
+        if dropped := self.message_queue.qsize():
+            logger.warning("discarding %s queued messages on shutdown", dropped)
+        while not self.message_queue.empty():
+            self.message_queue.get_nowait()
+            self.message_queue.task_done()
+        try:
+            if self.has_pending_verification():
+                async with db_session_manager():
+                    await self.flush_verification()
+        except Exception:  # Catch everything so that the bot still shuts down
+            logger.exception("error: exception flushing verification records on close")
+        finally:
+            await super().close()
+
+    async def message_worker(self) -> None:
+        while True:
+            message = await self.message_queue.get()
+            try:
+                await self.process_message(message)
+            except Exception:  # Catch everything so that the worker doesn't die
+                logger.exception("error: exception in message worker")
+            finally:
+                self.message_queue.task_done()
+
+    async def verification_flusher(self) -> None:
+        backoff = VERIFY_FLUSH_INTERVAL_S
+        while True:
+            with suppress(TimeoutError):
+                await asyncio.wait_for(self.verify_flush_event.wait(), VERIFY_FLUSH_INTERVAL_S)
+            self.verify_flush_event.clear()
+            if not self.has_pending_verification():
+                continue
+            try:
+                async with db_session_manager():
+                    await self.flush_verification()
+            except Exception:  # Catch everything so that the flusher doesn't die
+                logger.exception("error: exception in verification flusher")
+                # back off so that a database outage isn't hammered with retries
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, VERIFY_FLUSH_MAX_BACKOFF_S)
+            else:
+                backoff = VERIFY_FLUSH_INTERVAL_S
 
     @asynccontextmanager
     async def guild_lock(self, guild_xid: int) -> AsyncGenerator[None, None]:
@@ -81,10 +195,12 @@ class SpellBot(AutoShardedBot):
         async with self.critical_lock:
             yield
 
-    @tracer.wrap()
-    async def create_spelltable_link(self) -> str | None:
-        if self.mock_games:
-            return f"http://exmaple.com/game/{uuid4()}"
+    @tracer.wrap(name="spellbot.client.create_spelltable_link")
+    async def _mock_spelltable_link(self) -> str | None:
+        return f"http://example.com/game/{token_hex(16)}"
+
+    @tracer.wrap(name="spellbot.client.create_spelltable_link")
+    async def _real_spelltable_link(self) -> str | None:
         return await generate_link()
 
     @tracer.wrap(name="interaction", resource="on_message")
@@ -97,36 +213,47 @@ class SpellBot(AutoShardedBot):
             setup_ignored_errors(span)
 
         # handle DMs normally
-        if not message.guild or not hasattr(message.guild, "id"):
+        if (guild_xid := getattr(message.guild, "id", None)) is None:
             return await super().on_message(message)
         if span:  # pragma: no cover
-            span.set_tag("guild_id", message.guild.id)
-
-        # ignore everything except messages in text channels
-        if not hasattr(message.channel, "type") or message.channel.type != discord.ChannelType.text:
-            return None
-        if span:  # pragma: no cover
-            span.set_tag("channel_id", message.channel.id)
+            span.set_tag("guild_id", guild_xid)
 
         # ignore hidden/ephemeral messages
         if message.flags.value & 64:
             return None
 
-        # to verify users we need their user id
-        if not hasattr(message.author, "id"):
+        # ignore webhooks and bots, including messages sent by this bot itself
+        author = message.author
+        if message.webhook_id is not None or getattr(author, "bot", False):
             return None
 
-        message_author_xid = message.author.id
-        if span:
-            span.set_tag("author_id", message_author_xid)
+        # ignore everything except messages in text channels
+        channel = message.channel
+        if getattr(channel, "type", None) != discord.ChannelType.text:
+            return None
+        if span:  # pragma: no cover
+            span.set_tag("channel_id", channel.id)
 
-        # don't try to verify the bot itself
-        if self.user and message_author_xid == self.user.id:  # pragma: no cover
+        # to verify users we need their user id
+        if (author_xid := getattr(author, "id", None)) is None:
             return None
+        if span:
+            span.set_tag("author_id", author_xid)
+
+        self.enqueue_message(message)
+        return None
+
+    def enqueue_message(self, message: discord.Message) -> None:
+        try:
+            self.message_queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("message queue full, dropping message %s", message.id)
+            add_span_kv("message_dropped", True)
 
+    @tracer.wrap(name="message", resource="process_message")
+    async def process_message(self, message: discord.Message) -> None:
         async with db_session_manager():
             await self.handle_verification(message)
-            return None
 
     @tracer.wrap(name="interaction", resource="on_message_delete")
     async def on_message_delete(self, message: discord.Message) -> None:
@@ -147,25 +274,83 @@ class SpellBot(AutoShardedBot):
 
     @tracer.wrap()
     async def handle_verification(self, message: discord.Message) -> None:
-        message_author_xid = message.author.id
-        verified: bool | None = None
-        guilds = GuildsService()
-        assert message.guild is not None
-        await guilds.upsert(message.guild)
-        channels = ChannelsService()
-        channel_data = await channels.upsert(message.channel)
-        if channel_data["auto_verify"]:
-            verified = True
-        verify = VerifiesService()
-        assert message.guild
-        guild: discord.Guild = message.guild
-        await verify.upsert(guild.id, message_author_xid, verified)
-        if not user_can_moderate(message.author, guild, message.channel):
-            user_is_verified = await verify.is_verified()
-            if user_is_verified and channel_data["unverified_only"]:
-                await safe_delete_message(message)
-            if not user_is_verified and channel_data["verified_only"]:
-                await safe_delete_message(message)
+        guild = message.guild
+        assert guild is not None
+        guild_xid = guild.id
+        channel = message.channel
+        channel_xid = channel.id
+        author = message.author
+        key = (guild_xid, author.id)
+
+        if (policy := self.channel_policy.get(channel_xid)) is None:
+            channels = ChannelsService()
+            policy = await channels.select_verify_policy(channel_xid)
+            self.channel_policy[channel_xid] = policy
+        if not policy:  # nothing to do in channels without verification settings
+            return
+
+        # records are written to the database later on by flush_verification()
+        self.pending_guilds[guild_xid] = guild
+        self.pending_channels[channel_xid] = channel
+        if policy & AUTO_VERIFY:
+            self.pending_verifies[key] = True
+            self.verify_cache[key] = True
+        else:
+            self.pending_verifies.setdefault(key, None)
+        if len(self.pending_verifies) >= VERIFY_FLUSH_THRESHOLD:
+            self.verify_flush_event.set()
+
+        if not policy & (VERIFIED_ONLY | UNVERIFIED_ONLY):
+            return
+        if self.can_moderate(author, guild, channel):
+            return
+        if (user_is_verified := self.verify_cache.get(key)) is None:
+            verify = VerifiesService()
+            user_is_verified = await verify.select_verified(*key)
+            self.verify_cache[key] = user_is_verified
+        if user_is_verified and policy & UNVERIFIED_ONLY:
+            await safe_delete_message(message)
+        if not user_is_verified and policy & VERIFIED_ONLY:
+            await safe_delete_message(message)
+
+    def can_moderate(
+        self,
+        author: discord.User | discord.Member,
+        guild: discord.Guild,
+        channel: MessageableChannel,
+    ) -> bool:
+        # Moderator status only changes with the author's roles or the channel's
+        # permissions, so it's fine for it to be a little stale in the meantime.
+        roles = getattr(author, "roles", None) or ()
+        key = (author.id, channel.id, tuple(role.id for role in roles if role is not None))
+        if (can_moderate := self.moderator_cache.get(key)) is None:
+            can_moderate = user_can_moderate(author, guild, channel)
+            self.moderator_cache[key] = can_moderate
+        return can_moderate
+
+    @tracer.wrap()
+    async def flush_verification(self) -> None:
+        guilds, self.pending_guilds = self.pending_guilds, {}
+        channels, self.pending_channels = self.pending_channels, {}
+        verifies, self.pending_verifies = self.pending_verifies, {}
+        try:
+            await GuildsService().upsert_many(list(guilds.values()))
+            await ChannelsService().upsert_many(list(channels.values()))
+            await VerifiesService().upsert_many(verifies)
+        except Exception:
+            # Put the batch back so that it is retried on the next flush, keeping
+            # anything queued in the meantime since it is at least as recent.
+            for guild_xid, guild in guilds.items():
+                self.pending_guilds.setdefault(guild_xid, guild)
+            for channel_xid, channel in channels.items():
+                self.pending_channels.setdefault(channel_xid, channel)
+            for key, verified in verifies.items():
+                if self.pending_verifies.get(key) is None:
+                    self.pending_verifies[key] = verified
+            raise
+
+    def has_pending_verification(self) -> bool:
+        return bool(self.pending_guilds or self.pending_channels or self.pending_verifies)
 
     @tracer.wrap()
     async def handle_message_deleted(self, message: discord.Message) -> None:
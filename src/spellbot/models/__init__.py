@@ -19,7 +19,13 @@ from .base import Base, create_all, literalquery, now, reverse_all  # noqa: I001
 
 from .award import GuildAward, UserAward, GuildAwardDict, UserAwardDict  # noqa: E402
 from .block import Block, BlockDict  # noqa: E402
-from .channel import Channel, ChannelDict  # noqa: E402
+from .channel import (  # noqa: E402
+    AUTO_VERIFY,
+    UNVERIFIED_ONLY,
+    VERIFIED_ONLY,
+    Channel,
+    ChannelDict,
+)
 from .game import Game, GameStatus, GameDict  # noqa: E402
 from .guild import Guild, GuildDict  # noqa: E402
 from .mirror import Mirror, MirrorDict  # noqa: E402
@@ -32,6 +38,7 @@ from .verify import Verify, VerifyDict  # noqa: E402
 from .watch import Watch, WatchDict  # noqa: E402
 
 __all__ = [
+    "AUTO_VERIFY",
     "Base",
     "Block",
     "BlockDict",
@@ -60,10 +67,12 @@ __all__ = [
     "Record",
     "RecordDict",
     "reverse_all",
+    "UNVERIFIED_ONLY",
     "User",
     "UserAward",
     "UserAwardDict",
     "UserDict",
+    "VERIFIED_ONLY",
     "Verify",
     "VerifyDict",
     "Watch",
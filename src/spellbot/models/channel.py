@@ -38,6 +38,14 @@ class ChannelDict(TypedDict):
     require_confirmation: bool
 
 
+CHANNEL_COLUMNS = tuple(ChannelDict.__annotations__)
+
+# Bits of a channel's packed verification settings, see ChannelsService.select_verify_policy().
+AUTO_VERIFY = 1
+UNVERIFIED_ONLY = 2
+VERIFIED_ONLY = 4
+
+
 class Channel(Base):
     """Represents a Discord text channel."""
 
@@ -179,23 +187,11 @@ class Channel(Base):
     )
 
     def to_dict(self) -> ChannelDict:
-        return {
-            "xid": self.xid,
-            "created_at": self.created_at,
-            "updated_at": self.updated_at,
-            "guild_xid": self.guild_xid,
-            "name": self.name,
-            "default_seats": self.default_seats,
-            "default_format": GameFormat(cast(int, self.default_format)),
-            "default_service": GameService(cast(int, self.default_service)),
-            "auto_verify": self.auto_verify,
-            "unverified_only": self.unverified_only,
-            "verified_only": self.verified_only,
-            "motd": self.motd,
-            "extra": self.extra,
-            "voice_category": self.voice_category,
-            "voice_invite": self.voice_invite,
-            "delete_expired": self.delete_expired,
-            "show_points": self.show_points,
-            "require_confirmation": self.require_confirmation,
-        }
+        # Loaded column values are read straight out of the instance dict, skipping the
+        # instrumented attribute descriptors. Anything that isn't loaded, for example
+        # because it was expired by a commit, is still fetched via normal attribute access.
+        state = self.__dict__
+        data = {col: state[col] if col in state else getattr(self, col) for col in CHANNEL_COLUMNS}
+        data["default_format"] = GameFormat(cast(int, data["default_format"]))
+        data["default_service"] = GameService(cast(int, data["default_service"]))
+        return cast(ChannelDict, data)
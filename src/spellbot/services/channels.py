@@ -9,7 +9,7 @@ from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.sql.expression import update
 
 from spellbot.database import DatabaseSession
-from spellbot.models import Channel, ChannelDict
+from spellbot.models import AUTO_VERIFY, UNVERIFIED_ONLY, VERIFIED_ONLY, Channel, ChannelDict
 
 if TYPE_CHECKING:
     from discord.abc import MessageableChannel
@@ -43,6 +43,34 @@ class ChannelsService:
         db_channel = DatabaseSession.query(Channel).filter(Channel.xid == channel.id).one()
         return db_channel.to_dict()
 
+    @sync_to_async()
+    def upsert_many(self, channels: list[MessageableChannel]) -> None:
+        if not channels:
+            return
+        name_max_len = Channel.name.property.columns[0].type.length  # type: ignore
+        updated_at = datetime.now(tz=pytz.utc)
+        values = []
+        for channel in channels:
+            assert channel.guild is not None
+            values.append(
+                {
+                    "xid": channel.id,
+                    "guild_xid": channel.guild.id,
+                    "name": getattr(channel, "name", "")[:name_max_len],
+                    "updated_at": updated_at,
+                },
+            )
+        upsert = insert(Channel).values(values)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[Channel.xid],
+            set_={
+                "name": upsert.excluded.name,
+                "updated_at": upsert.excluded.updated_at,
+            },
+        )
+        DatabaseSession.execute(upsert)
+        DatabaseSession.commit()
+
     @sync_to_async()
     def forget(self, xid: int) -> None:
         DatabaseSession.query(Channel).filter(Channel.xid == xid).delete(synchronize_session=False)
@@ -52,6 +80,27 @@ class ChannelsService:
         channel = DatabaseSession.query(Channel).filter(Channel.xid == xid).one_or_none()
         return channel.to_dict() if channel else None
 
+    @sync_to_async()
+    def select_verify_policy(self, xid: int) -> int:
+        # returns the verification settings packed into AUTO_VERIFY, VERIFIED_ONLY,
+        # and UNVERIFIED_ONLY bits, which is 0 for unknown channels
+        row = (
+            DatabaseSession.query(
+                Channel.auto_verify,
+                Channel.verified_only,
+                Channel.unverified_only,
+            )
+            .filter(Channel.xid == xid)
+            .one_or_none()
+        )
+        if row is None:
+            return 0
+        return (
+            (AUTO_VERIFY if row.auto_verify else 0)
+            | (VERIFIED_ONLY if row.verified_only else 0)
+            | (UNVERIFIED_ONLY if row.unverified_only else 0)
+        )
+
     @sync_to_async()
     def set_default_seats(self, xid: int, seats: int) -> None:
         query = (
@@ -48,6 +48,31 @@ class GuildsService:
         )
         return self.guild.to_dict() if self.guild else None
 
+    @sync_to_async()
+    def upsert_many(self, guilds: list[discord.Guild]) -> None:
+        if not guilds:
+            return
+        name_max_len = Guild.name.property.columns[0].type.length  # type: ignore
+        updated_at = datetime.now(tz=pytz.utc)
+        values = [
+            {
+                "xid": guild.id,
+                "name": getattr(guild, "name", "")[:name_max_len],
+                "updated_at": updated_at,
+            }
+            for guild in guilds
+        ]
+        upsert = insert(Guild).values(values)
+        upsert = upsert.on_conflict_do_update(
+            index_elements=[Guild.xid],
+            set_={
+                "name": upsert.excluded.name,
+                "updated_at": upsert.excluded.updated_at,
+            },
+        )
+        DatabaseSession.execute(upsert)
+        DatabaseSession.commit()
+
     @sync_to_async()
     def set_banned(self, banned: bool, xid: int) -> None:
         values = {
@@ -49,6 +49,45 @@ class VerifiesService:
             .one_or_none()
         )
 
+    @sync_to_async()
+    def upsert_many(self, verifies: dict[tuple[int, int], bool | None]) -> None:
+        # keys are (guild_xid, user_xid), a verified setting of None only creates
+        # the record if it's missing rather than overwriting the existing setting
+        touched = [
+            {"guild_xid": guild_xid, "user_xid": user_xid}
+            for (guild_xid, user_xid), verified in verifies.items()
+            if verified is None
+        ]
+        if touched:
+            DatabaseSession.execute(insert(Verify).values(touched).on_conflict_do_nothing())
+        updated = [
+            {"guild_xid": guild_xid, "user_xid": user_xid, "verified": verified}
+            for (guild_xid, user_xid), verified in verifies.items()
+            if verified is not None
+        ]
+        if updated:
+            upsert = insert(Verify).values(updated)
+            upsert = upsert.on_conflict_do_update(
+                constraint="verify_pkey",
+                set_={"verified": upsert.excluded.verified},
+            )
+            DatabaseSession.execute(upsert)
+        DatabaseSession.commit()
+
+    @sync_to_async()
+    def select_verified(self, guild_xid: int, user_xid: int) -> bool:
+        verified = (
+            DatabaseSession.query(Verify.verified)
+            .filter(
+                and_(
+                    Verify.guild_xid == guild_xid,
+                    Verify.user_xid == user_xid,
+                ),
+            )
+            .scalar()
+        )
+        return bool(verified)
+
     @sync_to_async()
     def is_verified(self) -> bool:
         assert self.current
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import traceback
+import time
+from collections import OrderedDict
 from contextlib import AbstractContextManager
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 import discord
 from ddtrace import tracer
@@ -33,12 +34,25 @@ if TYPE_CHECKING:
 
 
 logger = logging.getLogger(__name__)
+KeyT = TypeVar("KeyT")
+ValueT = TypeVar("ValueT")
 
 # Discord API error code indicating that we can not send messages to this user.
 CANT_SEND_CODE = 50007
 
 EMBED_DESCRIPTION_SIZE_LIMIT = 4096
 
+# Replies sent to the user for expected errors that occur during interactions.
+INTERACTION_ERROR_REPLIES: dict[type[Exception], str] = {
+    AdminOnlyError: "You do not have permission to do that.",
+    GuildOnlyError: "This command only works in a guild.",
+    NoPrivateMessage: "This command is not supported in DMs.",
+    UserBannedError: "You have been banned from using SpellBot.",
+    GuildBannedError: "You have been banned from using SpellBot.",
+    UserUnverifiedError: "Only verified users can do that here.",
+    UserVerifiedError: "Only unverified users can do that here.",
+}
+
 
 def log_warning(log: str, exec_info: bool = False, **kwargs: Any) -> None:
     message = f"warning: discord: {log}"
@@ -267,6 +281,53 @@ class suppress(AbstractContextManager[None]):
         return captured
 
 
+class ExpiringDict(Generic[KeyT, ValueT]):
+    """
+    A size bounded mapping whose entries expire some time after they were set.
+
+    Since every entry lives for the same amount of time, insertion order is also
+    expiration order. That means that both expiring and evicting entries only ever
+    has to look at the oldest entries, so every operation is constant time.
+    """
+
+    __slots__ = ("_data", "_max_len", "_max_age")
+
+    def __init__(self, *, max_len: int, max_age_seconds: float) -> None:
+        self._data: OrderedDict[KeyT, tuple[float, ValueT]] = OrderedDict()
+        self._max_len = max_len
+        self._max_age = max_age_seconds
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __setitem__(self, key: KeyT, value: ValueT) -> None:
+        now = time.monotonic()
+        self._data.pop(key, None)
+        self._data[key] = (now + self._max_age, value)
+        while self._data:
+            oldest_expires_at, _ = next(iter(self._data.values()))
+            if len(self._data) <= self._max_len and oldest_expires_at > now:
+                break
+            self._data.popitem(last=False)
+
+    def get(self, key: KeyT, default: ValueT | None = None) -> ValueT | None:
+        if (item := self._data.get(key)) is None:
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+        return value
+
+    def pop(self, key: KeyT, default: ValueT | None = None) -> ValueT | None:
+        value = self.get(key, default)
+        self._data.pop(key, None)
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
 # I have no idea how to properly type hint this.
 def for_all_callbacks(decorator: Any) -> Any:
     def decorate(cls: Any) -> Any:
@@ -283,31 +344,31 @@ def for_all_callbacks(decorator: Any) -> Any:
 async def handle_interaction_errors(interaction: discord.Interaction, error: Exception) -> None:
     from .operations import safe_send_user
 
-    if isinstance(error, AdminOnlyError):
-        return await safe_send_user(interaction.user, "You do not have permission to do that.")
-    if isinstance(error, GuildOnlyError):
-        return await safe_send_user(interaction.user, "This command only works in a guild.")
-    if isinstance(error, NoPrivateMessage):
-        return await safe_send_user(interaction.user, "This command is not supported in DMs.")
-    if isinstance(error, UserBannedError):
-        return await safe_send_user(interaction.user, "You have been banned from using SpellBot.")
-    if isinstance(error, GuildBannedError):
-        return await safe_send_user(interaction.user, "You have been banned from using SpellBot.")
-    if isinstance(error, UserUnverifiedError):
-        return await safe_send_user(interaction.user, "Only verified users can do that here.")
-    if isinstance(error, UserVerifiedError):
-        return await safe_send_user(interaction.user, "Only unverified users can do that here.")
+    reply = INTERACTION_ERROR_REPLIES.get(type(error))
+    if reply is None:  # fall back to matching subclasses of the known errors
+        reply = next(
+            (r for t, r in INTERACTION_ERROR_REPLIES.items() if isinstance(error, t)),
+            None,
+        )
+    if reply is not None:
+        return await safe_send_user(interaction.user, reply)
 
     add_span_error(error)
-    ref = (
-        f"command `{interaction.command.qualified_name}`"
-        if interaction.command is not None and isinstance(interaction, AppCommand | ExtCommand)
-        else f"component `{interaction.command.qualified_name}`"
-        if interaction.command is not None and isinstance(interaction, ContextMenu)
-        else f"interaction `{interaction.id}`"
-    )
-    logger.error("error: unhandled exception in %s: %s: %s", ref, error.__class__.__name__, error)
-    traceback.print_tb(error.__traceback__)
+    if logger.isEnabledFor(logging.ERROR):
+        ref = (
+            f"command `{interaction.command.qualified_name}`"
+            if interaction.command is not None and isinstance(interaction, AppCommand | ExtCommand)
+            else f"component `{interaction.command.qualified_name}`"
+            if interaction.command is not None and isinstance(interaction, ContextMenu)
+            else f"interaction `{interaction.id}`"
+        )
+        logger.error(
+            "error: unhandled exception in %s: %s: %s",
+            ref,
+            error.__class__.__name__,
+            error,
+            exc_info=error,
+        )
     return None
 
 
@@ -284,6 +284,7 @@ class TestCogAdminChannels(InteractionMixin):
 
     async def test_auto_verify(self, cog: AdminCog) -> None:
         default_value = Channel.auto_verify.default.arg  # type: ignore
+        self.bot.channel_policy[self.channel.xid] = 0
         await self.run(cog.auto_verify, setting=not default_value)
         self.interaction.response.send_message.assert_called_once_with(
             f"Auto verification set to {not default_value} for this channel.",
@@ -291,9 +292,11 @@ class TestCogAdminChannels(InteractionMixin):
         )
         channel = DatabaseSession.query(Channel).one()
         assert channel.auto_verify != default_value
+        assert self.bot.channel_policy.get(channel.xid) is None
 
     async def test_verified_only(self, cog: AdminCog) -> None:
         default_value = Channel.verified_only.default.arg  # type: ignore
+        self.bot.channel_policy[self.channel.xid] = 0
         await self.run(cog.verified_only, setting=not default_value)
         self.interaction.response.send_message.assert_called_once_with(
             f"Verified only set to {not default_value} for this channel.",
@@ -301,9 +304,11 @@ class TestCogAdminChannels(InteractionMixin):
         )
         channel = DatabaseSession.query(Channel).one()
         assert channel.verified_only != default_value
+        assert self.bot.channel_policy.get(channel.xid) is None
 
     async def test_unverified_only(self, cog: AdminCog) -> None:
         default_value = Channel.unverified_only.default.arg  # type: ignore
+        self.bot.channel_policy[self.channel.xid] = 0
         await self.run(cog.unverified_only, setting=not default_value)
         self.interaction.response.send_message.assert_called_once_with(
             f"Unverified only set to {not default_value} for this channel.",
@@ -311,6 +316,7 @@ class TestCogAdminChannels(InteractionMixin):
         )
         channel = DatabaseSession.query(Channel).one()
         assert channel.unverified_only != default_value
+        assert self.bot.channel_policy.get(channel.xid) is None
 
     async def test_voice_category(self, cog: AdminCog) -> None:
         default_value = Channel.voice_category.default.arg  # type: ignore
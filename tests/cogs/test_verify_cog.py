@@ -8,6 +8,7 @@ import pytest_asyncio
 from spellbot.cogs import VerifyCog
 from spellbot.database import DatabaseSession
 from spellbot.models import User, Verify
+from spellbot.services import VerifiesService
 
 from tests.mixins import InteractionMixin
 from tests.mocks import mock_discord_object
@@ -30,7 +31,10 @@ class TestCogVerify(InteractionMixin):
         return cast(discord.Member, mock_discord_object(add_user()))
 
     async def test_verify_and_unverify(self, cog: VerifyCog, target: discord.Member) -> None:
+        self.bot.verify_cache[(self.guild.xid, target.id)] = False
         await self.run(cog.verify, target=target)
+        assert self.bot.verify_cache.get((self.guild.xid, target.id)) is True
+        assert self.bot.pending_verifies == {(self.guild.xid, target.id): True}
 
         self.interaction.response.send_message.assert_called_once_with(
             f"Verified <@{target.id}>.",
@@ -50,3 +54,32 @@ class TestCogVerify(InteractionMixin):
         )
         found = DatabaseSession.query(Verify).filter(Verify.user_xid == target.id).one()
         assert not found.verified
+
+    async def test_unverify_during_flush(
+        self,
+        cog: VerifyCog,
+        target: discord.Member,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        key = (self.guild.xid, target.id)
+        self.bot.pending_verifies[key] = True
+        upsert_many = VerifiesService().upsert_many
+
+        async def upsert_many_racing_unverify(
+            _: VerifiesService,
+            verifies: dict[tuple[int, int], bool | None],
+        ) -> None:
+            await self.run(cog.unverify, target=target)
+            await upsert_many(verifies)
+
+        with monkeypatch.context() as m:
+            m.setattr(VerifiesService, "upsert_many", upsert_many_racing_unverify)
+            await self.bot.flush_verification()
+
+        # the in-flight batch landed after the unverify, so it must be reapplied
+        assert self.bot.pending_verifies == {key: False}
+        await self.bot.flush_verification()
+
+        DatabaseSession.expire_all()
+        found = DatabaseSession.query(Verify).filter(Verify.user_xid == target.id).one()
+        assert not found.verified
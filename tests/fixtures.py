@@ -229,7 +229,7 @@ def cli() -> Generator[MagicMock, None, None]:
     with (
         patch("spellbot.cli.asyncio") as mock_asyncio,
         patch("spellbot.cli.configure_logging") as mock_configure_logging,
-        patch("spellbot.cli.hupper") as mock_hupper,
+        patch("hupper.start_reloader") as mock_start_reloader,
         patch("spellbot.client.build_bot") as mock_build_bot,
         patch("spellbot.cli.settings") as mock_settings,
         patch("spellbot.web.launch_web_server") as mock_launch_web_server,
@@ -243,7 +243,8 @@ def cli() -> Generator[MagicMock, None, None]:
         mock_bot = MagicMock(name="bot")
         mock_bot.run = MagicMock(name="run")
         mock_build_bot.return_value = mock_bot
-        mock_hupper.start_reloader = MagicMock(name="start_reloader")
+        mock_hupper = MagicMock(name="hupper")
+        mock_hupper.start_reloader = mock_start_reloader
         mock_settings.BOT_TOKEN = "facedeadbeef"
         mock_settings.PORT = 404
 
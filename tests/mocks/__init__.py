@@ -140,6 +140,7 @@ def build_author(offset: int = 1) -> discord.User:
     author.id = 1000 + offset
     author.display_name = f"user-{author.id}"
     author.mention = f"<@{author.id}>"
+    author.bot = False
     author.send = AsyncMock()
     author.roles = []
     author.top_role = None
@@ -179,6 +180,7 @@ def build_message(
     message.guild = guild
     message.channel = channel
     message.author = author
+    message.webhook_id = None
     message.reply = AsyncMock()
     message.delete = AsyncMock()
     message.edit = AsyncMock()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+from spellbot.database import DatabaseSession
 from spellbot.enums import GameFormat, GameService
 
 if TYPE_CHECKING:
@@ -33,3 +34,16 @@ class TestModelChannel:
             "show_points": channel.show_points,
             "require_confirmation": channel.require_confirmation,
         }
+
+    def test_channel_to_dict_when_expired(self, factories: Factories) -> None:
+        guild = factories.guild.create()
+        channel = factories.channel.create(guild=guild, name="expired", auto_verify=True)
+
+        DatabaseSession.expire(channel)
+        data = channel.to_dict()
+
+        assert data["xid"] == channel.xid
+        assert data["name"] == "expired"
+        assert data["auto_verify"] is True
+        assert data["default_format"] == GameFormat(channel.default_format)
+        assert data["default_service"] == GameService(channel.default_service)
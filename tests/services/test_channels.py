@@ -4,7 +4,7 @@ from unittest.mock import MagicMock
 
 import pytest
 from spellbot.database import DatabaseSession
-from spellbot.models import Channel, Guild
+from spellbot.models import AUTO_VERIFY, UNVERIFIED_ONLY, Channel, Guild
 from spellbot.services import ChannelsService
 
 from tests.factories import ChannelFactory
@@ -37,6 +37,30 @@ class TestServiceChannels:
         assert channel.xid == discord_channel.id
         assert channel.name == "new-name"
 
+    async def test_channels_upsert_many(self, guild: Guild) -> None:
+        ChannelFactory.create(guild=guild, xid=201, name="old-name")
+        discord_guild = MagicMock()
+        discord_guild.id = guild.xid
+        discord_channel1 = MagicMock()
+        discord_channel1.id = 201
+        discord_channel1.name = "new-name"
+        discord_channel1.guild = discord_guild
+        discord_channel2 = MagicMock()
+        discord_channel2.id = 202
+        discord_channel2.name = "channel-name"
+        discord_channel2.guild = discord_guild
+        channels = ChannelsService()
+        await channels.upsert_many([discord_channel1, discord_channel2])
+
+        DatabaseSession.expire_all()
+        found1 = DatabaseSession.query(Channel).get(201)
+        assert found1
+        assert found1.name == "new-name"
+        found2 = DatabaseSession.query(Channel).get(202)
+        assert found2
+        assert found2.guild_xid == guild.xid
+        assert found2.name == "channel-name"
+
     async def test_channels_select(self, guild: Guild) -> None:
         channels = ChannelsService()
         assert not await channels.select(404)
@@ -44,6 +68,13 @@ class TestServiceChannels:
         ChannelFactory.create(guild=guild, xid=404)
         assert await channels.select(404)
 
+    async def test_channels_select_verify_policy(self, guild: Guild) -> None:
+        channels = ChannelsService()
+        assert await channels.select_verify_policy(404) == 0
+
+        ChannelFactory.create(guild=guild, xid=404, auto_verify=True, unverified_only=True)
+        assert await channels.select_verify_policy(404) == AUTO_VERIFY | UNVERIFIED_ONLY
+
     async def test_channels_current_default_seats(self, channel: Channel) -> None:
         channels = ChannelsService()
         data = await channels.select(channel.xid)
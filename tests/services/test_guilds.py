@@ -34,6 +34,25 @@ class TestServiceGuilds:
         assert guild.xid == discord_guild.id
         assert guild.name == "new-name"
 
+    async def test_guilds_upsert_many(self) -> None:
+        guild1 = GuildFactory.create(name="old-name")
+        discord_guild1 = MagicMock()
+        discord_guild1.id = guild1.xid
+        discord_guild1.name = "new-name"
+        discord_guild2 = MagicMock()
+        discord_guild2.id = 102
+        discord_guild2.name = "guild-name"
+        guilds = GuildsService()
+        await guilds.upsert_many([discord_guild1, discord_guild2])
+
+        DatabaseSession.expire_all()
+        found1 = DatabaseSession.query(Guild).get(discord_guild1.id)
+        assert found1
+        assert found1.name == "new-name"
+        found2 = DatabaseSession.query(Guild).get(discord_guild2.id)
+        assert found2
+        assert found2.name == "guild-name"
+
     async def test_guilds_select(self) -> None:
         guilds = GuildsService()
         assert not await guilds.select(404)
@@ -25,3 +25,21 @@ class TestServiceVerifies:
 
         await verifies.upsert(guild.xid, user.xid, verified=False)
         assert not await verifies.is_verified()
+
+    async def test_verifies_upsert_many(self, guild: Guild, factories: Factories) -> None:
+        user1 = factories.user.create()
+        user2 = factories.user.create()
+        factories.verify.create(guild_xid=guild.xid, user_xid=user1.xid, verified=True)
+
+        verifies = VerifiesService()
+        await verifies.upsert_many({(guild.xid, user1.xid): None, (guild.xid, user2.xid): None})
+        assert await verifies.select_verified(guild.xid, user1.xid)
+        assert not await verifies.select_verified(guild.xid, user2.xid)
+
+        await verifies.upsert_many({(guild.xid, user1.xid): False, (guild.xid, user2.xid): True})
+        assert not await verifies.select_verified(guild.xid, user1.xid)
+        assert await verifies.select_verified(guild.xid, user2.xid)
+
+    async def test_verifies_select_verified_missing(self, guild: Guild) -> None:
+        verifies = VerifiesService()
+        assert not await verifies.select_verified(guild.xid, 404)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
@@ -17,7 +18,7 @@ from spellbot.errors import (
     UserUnverifiedError,
     UserVerifiedError,
 )
-from spellbot.models import Channel, Guild, Verify
+from spellbot.models import VERIFIED_ONLY, Channel, Guild, Verify
 from spellbot.utils import handle_interaction_errors
 
 from .mixins import BaseMixin
@@ -28,14 +29,10 @@ class TestSpellBot(BaseMixin):
     async def test_create_spelltable_link_mock(self, bot: SpellBot) -> None:
         link = await bot.create_spelltable_link()
         assert link is not None
-        assert link.startswith("http://exmaple.com/game/")
+        assert link.startswith("http://example.com/game/")
 
-    async def test_create_spelltable_link(
-        self,
-        bot: SpellBot,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
-        bot.mock_games = False
+    async def test_create_spelltable_link(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        bot = client.build_bot(mock_games=False, create_connection=False)
         generate_link_mock = AsyncMock(return_value="http://mock")
         monkeypatch.setattr(client, "generate_link", generate_link_mock)
         link = await bot.create_spelltable_link()
@@ -91,6 +88,16 @@ class TestSpellBot(BaseMixin):
         await handle_interaction_errors(interaction, error)
         interaction.user.send.assert_called_once_with(response)
 
+    async def test_handle_interaction_errors_subclass(
+        self,
+        interaction: discord.Interaction,
+    ) -> None:
+        class CustomAdminOnlyError(AdminOnlyError):
+            pass
+
+        await handle_interaction_errors(interaction, CustomAdminOnlyError())
+        interaction.user.send.assert_called_once_with("You do not have permission to do that.")
+
     async def test_handle_interaction_errors_unhandled_exception(
         self,
         interaction: discord.Interaction,
@@ -121,6 +128,9 @@ class TestSpellBot(BaseMixin):
         monkeypatch.setattr(AutoShardedBot, "on_message", super_on_message_mock)
         message = MagicMock()
         message.guild = MagicMock()
+        message.webhook_id = None
+        message.author.bot = False
+        message.flags.value = 0
         message.channel = MagicMock()
         del message.channel.type
         await bot.on_message(message)
@@ -131,12 +141,35 @@ class TestSpellBot(BaseMixin):
         monkeypatch.setattr(AutoShardedBot, "on_message", super_on_message_mock)
         message = MagicMock()
         message.guild = MagicMock()
+        message.webhook_id = None
+        message.author.bot = False
         message.channel = MagicMock()
         message.channel.type = discord.ChannelType.text
         message.flags.value = 64
         await bot.on_message(message)
         super_on_message_mock.assert_not_called()
 
+    async def test_on_message_from_bot(
+        self,
+        dpy_message: discord.Message,
+        bot: SpellBot,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(dpy_message.author, "bot", True)
+        dpy_message.flags.value = 0
+        await bot.on_message(dpy_message)
+        assert bot.message_queue.empty()
+
+    async def test_on_message_from_webhook(
+        self,
+        dpy_message: discord.Message,
+        bot: SpellBot,
+    ) -> None:
+        dpy_message.webhook_id = 1234
+        dpy_message.flags.value = 0
+        await bot.on_message(dpy_message)
+        assert bot.message_queue.empty()
+
     async def test_on_message_happy_path(
         self,
         dpy_message: discord.Message,
@@ -149,9 +182,122 @@ class TestSpellBot(BaseMixin):
         dpy_message.flags.value = 16
         await bot.on_message(dpy_message)
         super_on_message_mock.assert_not_called()
-        bot.handle_verification.assert_called_once_with(dpy_message)
+        bot.handle_verification.assert_not_called()
+        assert bot.message_queue.get_nowait() is dpy_message
         dpy_message.reply.assert_not_called()
 
+    async def test_on_message_queue_full(
+        self,
+        dpy_message: discord.Message,
+        bot: SpellBot,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        bot.message_queue = asyncio.Queue(maxsize=1)
+        bot.message_queue.put_nowait(MagicMock())
+        dpy_message.flags.value = 16
+        await bot.on_message(dpy_message)
+        assert bot.message_queue.qsize() == 1
+        assert "message queue full" in caplog.text
+
+    async def test_process_message(
+        self,
+        dpy_message: discord.Message,
+        bot: SpellBot,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(bot, "handle_verification", AsyncMock())
+        await bot.process_message(dpy_message)
+        bot.handle_verification.assert_called_once_with(dpy_message)
+
+    async def test_message_worker(
+        self,
+        dpy_message: discord.Message,
+        bot: SpellBot,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(bot, "process_message", AsyncMock())
+        worker = asyncio.create_task(bot.message_worker())
+        bot.message_queue.put_nowait(dpy_message)
+        await asyncio.wait_for(bot.message_queue.join(), 1)
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        bot.process_message.assert_called_once_with(dpy_message)
+
+    async def test_message_worker_survives_exception(
+        self,
+        dpy_message: discord.Message,
+        bot: SpellBot,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        monkeypatch.setattr(bot, "process_message", AsyncMock(side_effect=[RuntimeError, None]))
+        worker = asyncio.create_task(bot.message_worker())
+        bot.message_queue.put_nowait(dpy_message)
+        bot.message_queue.put_nowait(dpy_message)
+        await asyncio.wait_for(bot.message_queue.join(), 1)
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+        assert bot.process_message.call_count == 2
+        assert "exception in message worker" in caplog.text
+
+    async def test_verification_flusher(
+        self,
+        bot: SpellBot,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        flushed = asyncio.Event()
+
+        async def flush_verification() -> None:
+            bot.pending_guilds.clear()
+            flushed.set()
+
+        monkeypatch.setattr(bot, "flush_verification", flush_verification)
+        flusher = asyncio.create_task(bot.verification_flusher())
+        bot.pending_guilds[1] = MagicMock()
+        bot.verify_flush_event.set()
+        await asyncio.wait_for(flushed.wait(), 1)
+        flusher.cancel()
+        await asyncio.gather(flusher, return_exceptions=True)
+        assert not bot.has_pending_verification()
+
+    async def test_verification_flusher_nothing_pending(
+        self,
+        bot: SpellBot,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(bot, "flush_verification", AsyncMock())
+        flusher = asyncio.create_task(bot.verification_flusher())
+        bot.verify_flush_event.set()
+        await asyncio.sleep(0.01)
+        flusher.cancel()
+        await asyncio.gather(flusher, return_exceptions=True)
+        bot.flush_verification.assert_not_called()
+
+    async def test_verification_flusher_survives_exception(
+        self,
+        bot: SpellBot,
+        monkeypatch: pytest.MonkeyPatch,
+        caplog: pytest.LogCaptureFixture,
+    ) -> None:
+        flushed = asyncio.Event()
+        failures = [RuntimeError("boom")]
+
+        async def flush_verification() -> None:
+            if failures:
+                raise failures.pop()
+            bot.pending_guilds.clear()
+            flushed.set()
+
+        monkeypatch.setattr(client, "VERIFY_FLUSH_INTERVAL_S", 0.01)
+        monkeypatch.setattr(bot, "flush_verification", flush_verification)
+        flusher = asyncio.create_task(bot.verification_flusher())
+        bot.pending_guilds[1] = MagicMock()
+        bot.verify_flush_event.set()
+        await asyncio.wait_for(flushed.wait(), 1)
+        flusher.cancel()
+        await asyncio.gather(flusher, return_exceptions=True)
+        assert "exception in verification flusher" in caplog.text
+
     async def test_on_message_delete_happy_path(
         self,
         dpy_message: discord.Message,
@@ -276,35 +422,35 @@ class TestSpellBot(BaseMixin):
 
 @pytest.mark.asyncio()
 class TestSpellBotHandleVerification(BaseMixin):
-    async def test_missing_author_id(self, monkeypatch: pytest.MonkeyPatch) -> None:
+    async def test_missing_author_id(self) -> None:
         message = MagicMock()
         message.guild = MagicMock()
         message.guild.id = 2
+        message.webhook_id = None
         message.channel = MagicMock()
         message.channel.type = discord.ChannelType.text
         message.flags.value = 1
         message.author = MagicMock()
+        message.author.bot = False
         del message.author.id
-        monkeypatch.setattr(self.bot, "handle_verification", MagicMock())
 
         await self.bot.on_message(message)
 
-        self.bot.handle_verification.assert_not_called()
+        assert self.bot.message_queue.empty()
 
-    async def test_without_auto_verify(self, dpy_message: discord.Message) -> None:
+    async def test_without_verify_settings(self, dpy_message: discord.Message) -> None:
         assert dpy_message.guild
-        assert dpy_message.author
         assert isinstance(dpy_message.guild, discord.Guild)
-        assert isinstance(dpy_message.author, discord.User)
+        self.factories.guild.create(xid=dpy_message.guild.id)
+        self.factories.channel.create(xid=dpy_message.channel.id, guild_xid=dpy_message.guild.id)
+
         await self.bot.handle_verification(dpy_message)
 
-        DatabaseSession.expire_all()
-        assert DatabaseSession.query(Guild).one().xid == dpy_message.guild.id
-        assert DatabaseSession.query(Channel).one().xid == dpy_message.channel.id
-        found = DatabaseSession.query(Verify).one()
-        assert found.guild_xid == dpy_message.guild.id
-        assert found.user_xid == dpy_message.author.id
-        assert not found.verified
+        assert not self.bot.pending_guilds
+        assert not self.bot.pending_channels
+        assert not self.bot.pending_verifies
+        assert DatabaseSession.query(Verify).count() == 0
+        dpy_message.delete.assert_not_called()
 
     async def test_with_auto_verify(self, dpy_message: discord.Message) -> None:
         assert dpy_message.guild
@@ -319,6 +465,7 @@ class TestSpellBotHandleVerification(BaseMixin):
         )
 
         await self.bot.handle_verification(dpy_message)
+        await self.bot.flush_verification()
 
         DatabaseSession.expire_all()
         assert DatabaseSession.query(Guild).one().xid == dpy_message.guild.id
@@ -328,6 +475,129 @@ class TestSpellBotHandleVerification(BaseMixin):
         assert found.user_xid == dpy_message.author.id
         assert found.verified
 
+    async def test_records_are_pending_until_flushed(self, dpy_message: discord.Message) -> None:
+        assert dpy_message.guild
+        assert isinstance(dpy_message.author, discord.User)
+        self.factories.guild.create(xid=dpy_message.guild.id)
+        self.factories.channel.create(
+            xid=dpy_message.channel.id,
+            verified_only=True,
+            guild_xid=dpy_message.guild.id,
+        )
+
+        await self.bot.handle_verification(dpy_message)
+
+        assert DatabaseSession.query(Verify).count() == 0
+        assert self.bot.pending_guilds == {dpy_message.guild.id: dpy_message.guild}
+        assert self.bot.pending_channels == {dpy_message.channel.id: dpy_message.channel}
+        assert self.bot.pending_verifies == {(dpy_message.guild.id, dpy_message.author.id): None}
+        assert not self.bot.verify_flush_event.is_set()
+
+        await self.bot.flush_verification()
+
+        assert not self.bot.pending_guilds
+        assert not self.bot.pending_channels
+        assert not self.bot.pending_verifies
+        found = DatabaseSession.query(Verify).one()
+        assert found.guild_xid == dpy_message.guild.id
+        assert found.user_xid == dpy_message.author.id
+        assert not found.verified
+
+    async def test_failed_flush_keeps_records_pending(
+        self,
+        dpy_message: discord.Message,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        assert dpy_message.guild
+        assert isinstance(dpy_message.author, discord.User)
+        self.factories.guild.create(xid=dpy_message.guild.id)
+        self.factories.channel.create(
+            xid=dpy_message.channel.id,
+            verified_only=True,
+            guild_xid=dpy_message.guild.id,
+        )
+        await self.bot.handle_verification(dpy_message)
+        monkeypatch.setattr(
+            client.VerifiesService,
+            "upsert_many",
+            AsyncMock(side_effect=RuntimeError("boom")),
+        )
+
+        with pytest.raises(RuntimeError):
+            await self.bot.flush_verification()
+
+        assert self.bot.pending_guilds == {dpy_message.guild.id: dpy_message.guild}
+        assert self.bot.pending_channels == {dpy_message.channel.id: dpy_message.channel}
+        assert self.bot.pending_verifies == {(dpy_message.guild.id, dpy_message.author.id): None}
+        assert self.bot.has_pending_verification()
+
+    async def test_flush_requested_at_threshold(
+        self,
+        dpy_message: discord.Message,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        assert dpy_message.guild
+        monkeypatch.setattr(client, "VERIFY_FLUSH_THRESHOLD", 1)
+        self.factories.guild.create(xid=dpy_message.guild.id)
+        self.factories.channel.create(
+            xid=dpy_message.channel.id,
+            auto_verify=True,
+            guild_xid=dpy_message.guild.id,
+        )
+
+        await self.bot.handle_verification(dpy_message)
+
+        assert self.bot.verify_flush_event.is_set()
+
+    async def test_verified_only_when_cached_verified(self, dpy_message: discord.Message) -> None:
+        assert dpy_message.guild
+        assert isinstance(dpy_message.author, discord.User)
+        self.factories.guild.create(xid=dpy_message.guild.id)
+        self.factories.channel.create(
+            xid=dpy_message.channel.id,
+            verified_only=True,
+            guild_xid=dpy_message.guild.id,
+        )
+        self.bot.verify_cache[(dpy_message.guild.id, dpy_message.author.id)] = True
+
+        await self.bot.handle_verification(dpy_message)
+
+        dpy_message.delete.assert_not_called()
+
+    async def test_auto_verify_is_cached(self, dpy_message: discord.Message) -> None:
+        assert dpy_message.guild
+        assert isinstance(dpy_message.author, discord.User)
+        self.factories.guild.create(xid=dpy_message.guild.id)
+        self.factories.channel.create(
+            xid=dpy_message.channel.id,
+            auto_verify=True,
+            guild_xid=dpy_message.guild.id,
+        )
+
+        await self.bot.handle_verification(dpy_message)
+
+        assert self.bot.verify_cache.get((dpy_message.guild.id, dpy_message.author.id))
+
+    async def test_channel_policy_is_cached(self, dpy_message: discord.Message) -> None:
+        assert dpy_message.guild
+        self.factories.guild.create(xid=dpy_message.guild.id)
+        channel = self.factories.channel.create(
+            xid=dpy_message.channel.id,
+            verified_only=True,
+            guild_xid=dpy_message.guild.id,
+        )
+
+        await self.bot.handle_verification(dpy_message)
+        dpy_message.delete.assert_called_once()
+        assert self.bot.channel_policy.get(channel.xid) == VERIFIED_ONLY
+
+        channel.verified_only = False  # type: ignore
+        DatabaseSession.commit()
+        dpy_message.delete.reset_mock()
+
+        await self.bot.handle_verification(dpy_message)
+        dpy_message.delete.assert_called_once()
+
     async def test_verified_only_when_unverified(self, dpy_message: discord.Message) -> None:
         assert dpy_message.guild
         assert isinstance(dpy_message.guild, discord.Guild)
@@ -417,6 +687,28 @@ class TestSpellBotHandleVerification(BaseMixin):
 
         dpy_message.delete.assert_not_called()
 
+    async def test_moderator_status_is_cached(
+        self,
+        dpy_message: discord.Message,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        assert dpy_message.guild
+        assert isinstance(dpy_message.guild, discord.Guild)
+        user_can_moderate_mock = MagicMock(return_value=True)
+        monkeypatch.setattr(client, "user_can_moderate", user_can_moderate_mock)
+        self.factories.guild.create(xid=dpy_message.guild.id)
+        self.factories.channel.create(
+            xid=dpy_message.channel.id,
+            verified_only=True,
+            guild_xid=dpy_message.guild.id,
+        )
+
+        await self.bot.handle_verification(dpy_message)
+        await self.bot.handle_verification(dpy_message)
+
+        user_can_moderate_mock.assert_called_once()
+        dpy_message.delete.assert_not_called()
+
     async def test_message_from_admin_role(
         self,
         dpy_message: discord.Message,
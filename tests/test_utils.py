@@ -7,6 +7,7 @@ import discord
 import pytest
 from spellbot.errors import AdminOnlyError, GuildOnlyError
 from spellbot.utils import (
+    ExpiringDict,
     bot_can_delete_channel,
     bot_can_delete_message,
     bot_can_manage_channels,
@@ -509,3 +510,48 @@ class TestUtilsUserCanModerate:
         user.id = 1
         user.roles = [role]
         assert not user_can_moderate(user, guild, channel)
+
+
+class TestUtilsExpiringDict:
+    def test_get_and_set(self) -> None:
+        cache: ExpiringDict[int, str] = ExpiringDict(max_len=10, max_age_seconds=60)
+        assert cache.get(1) is None
+        assert cache.get(1, "default") == "default"
+        cache[1] = "one"
+        assert cache.get(1) == "one"
+        assert len(cache) == 1
+
+    def test_max_len(self) -> None:
+        cache: ExpiringDict[int, str] = ExpiringDict(max_len=2, max_age_seconds=60)
+        cache[1] = "one"
+        cache[2] = "two"
+        cache[1] = "uno"
+        cache[3] = "three"
+        assert cache.get(1) == "uno"
+        assert cache.get(2) is None
+        assert cache.get(3) == "three"
+        assert len(cache) == 2
+
+    def test_max_age(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        now = 1000.0
+        monkeypatch.setattr("spellbot.utils.time.monotonic", lambda: now)
+        cache: ExpiringDict[int, str] = ExpiringDict(max_len=10, max_age_seconds=30)
+        cache[1] = "one"
+        now += 20
+        cache[2] = "two"
+        assert cache.get(1) == "one"
+        now += 15
+        assert cache.get(1) is None
+        assert cache.get(2) == "two"
+        now += 30
+        cache[3] = "three"
+        assert len(cache) == 1
+
+    def test_pop_and_clear(self) -> None:
+        cache: ExpiringDict[int, str] = ExpiringDict(max_len=10, max_age_seconds=60)
+        cache[1] = "one"
+        cache[2] = "two"
+        assert cache.pop(1) == "one"
+        assert cache.pop(1) is None
+        cache.clear()
+        assert len(cache) == 0